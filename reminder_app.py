@@ -1,34 +1,88 @@
-import json
+import bisect
+import functools
+import logging
+import math
+import mmap
+import os
+import re
+import shutil
 import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 from tkcalendar import DateEntry
-import threading
-import time
 from datetime import datetime
 import uuid
-import queue
-from playsound import playsound
+import orjson
+import subprocess
+import sys
 
+if sys.platform == "win32":
+    import winsound
+
+
+logger = logging.getLogger(__name__)
 
 REMINDERS_FILE = "reminders.json"
+SOUND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "notification_sound.wav")
+JOURNAL_FILE = "reminders.log"  # Append-only log of changes since the last snapshot
+SAVE_DELAY_MS = 500  # Coalesce bursts of journal entries into a single write
+RESIZE_DELAY_MS = 50  # Coalesce <Configure> bursts while the window is dragged
+MAX_AFTER_MS = 24 * 60 * 60 * 1000  # Longest single Tk timer; later reminders are re-armed
+LEGACY_TIME_FORMAT = "%Y-%m-%d %H:%M"
+ICON_SIZE = (20, 20)
+MIN_WRAPLENGTH = 100
+
+
+def parse_trigger_time(value):
+    """
+    Parse a stored trigger time. Saved files use ISO-8601; anything
+    fromisoformat rejects is retried with the legacy strptime format.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, LEGACY_TIME_FORMAT)
+
+
+@functools.lru_cache(maxsize=None)
+def _icon(path, size, resample=Image.Resampling.BICUBIC):
+    """
+    Load and resize an image once; later calls reuse the cached PhotoImage.
+    """
+    return ImageTk.PhotoImage(Image.open(path).resize(size, resample))
+
+
 class Reminder:
-    def __init__(self, title, description, trigger_time):
+    def __init__(self, title, description, trigger_time, reminder_id=None, is_active=True):
         """
         Initialize a reminder with unique ID, title, description, and trigger time
         """
-        self.id = str(uuid.uuid4())  # Unique identifier for each reminder
+        self.id = reminder_id or str(uuid.uuid4())  # Unique identifier for each reminder
         self.title = title
         self.description = description
         self.trigger_time = trigger_time
-        self.is_active = True  # Determines if the reminder is active or expired
-        
+        self.is_active = is_active  # Determines if the reminder is active or expired
+
+    @property
+    def trigger_time(self):
+        return self._trigger_time
+
+    @trigger_time.setter
+    def trigger_time(self, value):
+        # Cache the formatted time so redraws and saves don't call strftime every time
+        self._trigger_time = value
+        self._trigger_str = value.strftime("%Y-%m-%d %H:%M")
+
+    @property
+    def trigger_str(self):
+        return self._trigger_str
+
     def to_dict(self):
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "trigger_time": self.trigger_time.strftime("%Y-%m-%d %H:%M"),
+            "trigger_time": self.trigger_time,  # orjson serializes datetime as ISO-8601
             "is_active": self.is_active,
         }
 
@@ -37,7 +91,7 @@ class Reminder:
         return Reminder(
             title=data["title"],
             description=data["description"],
-            trigger_time=datetime.strptime(data["trigger_time"], "%Y-%m-%d %H:%M"),
+            trigger_time=parse_trigger_time(data["trigger_time"]),
             reminder_id=data["id"],
             is_active=data["is_active"],
         )
@@ -52,12 +106,28 @@ class ReminderApp:
         master.geometry("360x640")  # Mobile-sized screen
         
 
-        # Reminder Management
+        # Reminder Management (owned by the Tk main thread; the app runs no other threads)
         self.reminders = {}
-        self.monitoring_threads = {}
-        self.reminders_lock = threading.Lock()
-        self.notification_queue = queue.Queue()
-        self.stop_event = threading.Event()
+
+        # Check for the notification sound once instead of on every notification
+        self._sound_enabled = os.path.isfile(SOUND_PATH)
+        if not self._sound_enabled:
+            logger.warning("Notification sound not found at %s; notifications will be silent.", SOUND_PATH)
+
+        # Active reminders sorted by (trigger_time, reminder_id); one Tk timer tracks the head
+        self._due = []
+        self._due_job = None
+
+        # Card widgets shown in the list, keyed by reminder ID
+        self._card_widgets = {}
+        self._wraplength = MIN_WRAPLENGTH  # Description wrap width, kept in sync with the canvas
+
+        # Journal entries waiting for the debounced flush
+        self._pending_journal = []
+        self._flush_job = None
+
+        # Pending debounced scroll region update, if any
+        self._resize_job = None
 
         # Load Images
         self._load_images()
@@ -73,75 +143,178 @@ class ReminderApp:
         # Start on Main Screen
         self._show_screen(self.main_screen)
 
-        # Start notification handler thread
-        self.notification_thread = threading.Thread(
-            target=self._handle_notifications,
-            daemon=True
-        )
-        self.notification_thread.start()
-        
     def _load_reminders(self):
         """
-        Load reminders from the JSON file into the app.
+        Load reminders from the JSON snapshot, replay the journal on top of it,
+        and compact the two when the journal has grown too long.
         """
+        # A bad snapshot must not stop the journal replay, or later edits would never load
+        snapshot_damaged = False
         try:
-            with open(REMINDERS_FILE, "r") as file:
-                reminders_data = json.load(file)
-                for reminder_data in reminders_data:
-                    # Create Reminder objects from the JSON data
-                    reminder = Reminder(
-                        title=reminder_data["title"],
-                        description=reminder_data["description"],
-                        trigger_time=datetime.strptime(reminder_data["trigger_time"], "%Y-%m-%d %H:%M"),
-                    )
-                    reminder.id = reminder_data["id"]
-                    reminder.is_active = reminder_data["is_active"]
-
-                    # Skip past reminders
-                    if datetime.now() > reminder.trigger_time:
-                        reminder.is_active = False
-
-                    self.reminders[reminder.id] = reminder
+            reminders_data = self._read_snapshot()
+        except Exception as e:
+            logger.error("Error loading reminders: %s", e)
+            reminders_data = []
+            snapshot_damaged = True
 
-                    # Start monitoring active reminders
-                    if reminder.is_active:
-                        thread = threading.Thread(target=self._monitor_reminder, args=(reminder,), daemon=True)
-                        self.monitoring_threads[reminder.id] = thread
-                        thread.start()
+        # Create Reminder objects from the JSON data, skipping records that don't parse
+        for reminder_data in reminders_data:
+            try:
+                reminder = Reminder.from_dict(reminder_data)
+            except Exception as e:
+                logger.error("Skipping unreadable reminder in %s: %s", REMINDERS_FILE, e)
+                snapshot_damaged = True
+                continue
+            self.reminders[reminder.id] = reminder
 
-            print("Reminders loaded successfully.")
-        except FileNotFoundError:
-            print("No reminders file found. Starting fresh.")
+        try:
+            journal_length = self._replay_journal()
+            # Compaction rewrites the snapshot, so keep a copy of a damaged one first
+            if journal_length > 2 * len(reminders_data):
+                if not snapshot_damaged or self._backup_snapshot():
+                    self._save_reminders()
         except Exception as e:
-            print(f"Error loading reminders: {e}")
+            logger.error("Error replaying reminders journal: %s", e)
+
+        for reminder in self.reminders.values():
+            # Skip past reminders
+            if datetime.now() > reminder.trigger_time:
+                reminder.is_active = False
+
+            # Schedule active reminders
+            if reminder.is_active:
+                self._schedule_reminder(reminder)
+
+        logger.info("Reminders loaded successfully.")
 
         # Refresh the UI to display loaded reminders
         self._refresh_list()
 
+    def _backup_snapshot(self):
+        """
+        Copy a damaged snapshot aside before compaction replaces it. Returns
+        whether the copy succeeded.
+        """
+        backup_file = f"{REMINDERS_FILE}.{datetime.now():%Y%m%d%H%M%S}.bad"
+        try:
+            shutil.copyfile(REMINDERS_FILE, backup_file)
+        except Exception as e:
+            logger.error("Error backing up %s, skipping compaction: %s", REMINDERS_FILE, e)
+            return False
+        logger.warning("Damaged %s backed up to %s", REMINDERS_FILE, backup_file)
+        return True
+
+    def _read_snapshot(self):
+        """
+        Read the reminders snapshot through a read-only memory map.
+        """
+        try:
+            with open(REMINDERS_FILE, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        except FileNotFoundError:
+            logger.info("No reminders file found. Starting fresh.")
+            return []
+
+    def _replay_journal(self):
+        """
+        Apply the journal entries to the loaded reminders and return how many there were.
+        """
+        try:
+            with open(JOURNAL_FILE, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return 0
+
+        # An interrupted write leaves a torn final line; cut it off so the next
+        # flush starts on a fresh line instead of being glued onto the fragment
+        complete = data[:data.rfind(b"\n") + 1]
+        if len(complete) < len(data):
+            logger.warning("Discarding torn final line of %s", JOURNAL_FILE)
+            try:
+                os.truncate(JOURNAL_FILE, len(complete))
+            except OSError as e:
+                logger.error("Error truncating %s: %s", JOURNAL_FILE, e)
+
+        lines = complete.splitlines()
+        for line in lines:
+            try:
+                entry = orjson.loads(line)
+            except ValueError as e:
+                logger.error("Skipping unreadable journal line: %s", e)
+                continue
+
+            # A bad entry is skipped on its own so the edits after it still load
+            try:
+                if entry["op"] == "put":
+                    reminder = Reminder.from_dict(entry["reminder"])
+                    self.reminders[reminder.id] = reminder
+                elif entry["op"] == "del":
+                    self.reminders.pop(entry["id"], None)
+            except Exception as e:
+                logger.error("Skipping invalid journal entry: %s", e)
+        return len(lines)
+
+    def _append_journal(self, entry):
+        """
+        Queue a journal entry and schedule a flush shortly after the last change,
+        so a burst of edits is written once.
+        """
+        self._pending_journal.append(entry)
+        if self._flush_job is not None:
+            self.master.after_cancel(self._flush_job)
+        self._flush_job = self.master.after(SAVE_DELAY_MS, self._flush_journal)
+
+    def _flush_journal(self):
+        """
+        Append the queued journal entries to the journal file, one JSON line each.
+        """
+        self._flush_job = None
+        if not self._pending_journal:
+            return
+        data = b"".join(orjson.dumps(entry) + b"\n" for entry in self._pending_journal)
+        self._pending_journal = []
+        try:
+            fd = os.open(JOURNAL_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            logger.error("Error saving reminders: %s", e)
+
     def _save_reminders(self):
         """
-        Save all reminders to a file.
+        Compact all reminders into the snapshot file and truncate the journal.
+        Writes a temp file first and swaps it in, so a crash mid-write never
+        leaves a truncated file behind.
         """
+        tmp_file = REMINDERS_FILE + ".tmp"
         try:
-            with open(REMINDERS_FILE, "w") as file:
-                reminders_data = [reminder.to_dict() for reminder in self.reminders.values()]
-                json.dump(reminders_data, file, indent=4)
-            print("Reminders saved successfully.")
+            reminders_data = [reminder.to_dict() for reminder in self.reminders.values()]
+            with open(tmp_file, "wb") as file:
+                file.write(orjson.dumps(reminders_data))
+            os.replace(tmp_file, REMINDERS_FILE)
+            open(JOURNAL_FILE, "w").close()
+            logger.info("Reminders saved successfully.")
         except Exception as e:
-            print(f"Error saving reminders: {e}")
+            logger.error("Error saving reminders: %s", e)
 
     def _load_images(self):
         """
         Load and resize images for use in the app
         """
-        self.add_icon = ImageTk.PhotoImage(Image.open("add.png").resize((20, 20)))
-        self.trash_icon = ImageTk.PhotoImage(Image.open("trash.png").resize((20, 20)))
-        self.back_icon = ImageTk.PhotoImage(Image.open("logout.png").resize((20, 20)))
-        self.title_icon= ImageTk.PhotoImage(Image.open("title.png").resize((20, 20)))
-        self.description_icon= ImageTk.PhotoImage(Image.open("des.png").resize((20, 20)))
-        self.date_icon= ImageTk.PhotoImage(Image.open("calendar.png").resize((20, 20)))
-        self.clock_icon= ImageTk.PhotoImage(Image.open("clock.png").resize((20, 20)))
-        self.edit_icon = ImageTk.PhotoImage(Image.open("document.png").resize((20, 20)))
+        # BOX is a cheap area average, plenty for tiny chrome icons
+        self.add_icon = _icon("add.png", ICON_SIZE, Image.Resampling.BOX)
+        self.trash_icon = _icon("trash.png", ICON_SIZE, Image.Resampling.BOX)
+        self.back_icon = _icon("logout.png", ICON_SIZE, Image.Resampling.BOX)
+        self.title_icon = _icon("title.png", ICON_SIZE, Image.Resampling.BOX)
+        self.description_icon = _icon("des.png", ICON_SIZE, Image.Resampling.BOX)
+        self.date_icon = _icon("calendar.png", ICON_SIZE, Image.Resampling.BOX)
+        self.clock_icon = _icon("clock.png", ICON_SIZE, Image.Resampling.BOX)
+        self.edit_icon = _icon("document.png", ICON_SIZE, Image.Resampling.BOX)
 
     def _show_screen(self, screen):
         """
@@ -191,7 +364,7 @@ class ReminderApp:
 
         # Frame Inside the Canvas to Contain Reminder Cards
         self.reminder_list = tk.Frame(self.canvas)
-        self.canvas.create_window((0, 0), window=self.reminder_list, anchor="nw")
+        self._list_window_id = self.canvas.create_window((0, 0), window=self.reminder_list, anchor="nw")
 
         # Enable Mouse Wheel Scrolling
         self.master.bind_all("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 * (e.delta // 120), "units"))
@@ -201,8 +374,26 @@ class ReminderApp:
         Update the width of the canvas and reminder_list dynamically to match the parent frame.
         """
         canvas_width = event.width
-        self.canvas.itemconfig(self.canvas.create_window((0, 0), window=self.reminder_list, anchor="nw"), width=canvas_width)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))  # Update scroll region when width changes
+        self.canvas.itemconfig(self._list_window_id, width=canvas_width)
+
+        # Re-wrap card descriptions to the new width
+        wraplength = max(MIN_WRAPLENGTH, canvas_width - 40)
+        if wraplength != self._wraplength:
+            self._wraplength = wraplength
+            for card in self._card_widgets.values():
+                card["desc"].config(wraplength=wraplength)
+
+        # Update scroll region once the user stops resizing; bbox walks every card
+        if self._resize_job is not None:
+            self.master.after_cancel(self._resize_job)
+        self._resize_job = self.master.after(RESIZE_DELAY_MS, self._apply_scroll_region)
+
+    def _apply_scroll_region(self):
+        """
+        Apply the debounced scroll region update after a resize.
+        """
+        self._resize_job = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def _create_add_screen(self):
         """
@@ -274,46 +465,48 @@ class ReminderApp:
             return
 
         try:
-            # Parse the entered date and time
-            trigger_time = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+            # fromisoformat also takes seconds, offsets and "HHMM", so insist on HH:MM first
+            if not re.fullmatch(r"\d{2}:\d{2}", time_str):
+                raise ValueError(f"Invalid time: {time_str!r}")
+
+            # Parse the entered date and time; the date picker already yields ISO dates
+            trigger_time = datetime.fromisoformat(f"{date_str}T{time_str}")
 
             # Check if the entered time is in the past
             if trigger_time < datetime.now():
                 messagebox.showerror("Error", "You cannot set a reminder in the past.")
                 return
 
-            with self.reminders_lock:
-                if hasattr(self, 'editing_reminder_id') and self.editing_reminder_id:
-                    # Editing an existing reminder
-                    reminder_id = self.editing_reminder_id
-                    reminder = self.reminders[reminder_id]
-                    reminder.title = title
-                    reminder.description = description
-                    reminder.trigger_time = trigger_time
-                    reminder.is_active = True  # Reset to active
-                    self.editing_reminder_id = None  # Reset editing state
-                    print(f"Reminder {reminder_id} updated successfully.")
-                else:
-                    # Adding a new reminder
-                    reminder = Reminder(title, description, trigger_time)
-                    self.reminders[reminder.id] = reminder
-
-                    # Start monitoring thread
-                    thread = threading.Thread(target=self._monitor_reminder, args=(reminder,), daemon=True)
-                    self.monitoring_threads[reminder.id] = thread
-                    thread.start()
+            if hasattr(self, 'editing_reminder_id') and self.editing_reminder_id:
+                # Editing an existing reminder
+                reminder_id = self.editing_reminder_id
+                reminder = self.reminders[reminder_id]
+                reminder.title = title
+                reminder.description = description
+                reminder.trigger_time = trigger_time
+                reminder.is_active = True  # Reset to active
+                self.editing_reminder_id = None  # Reset editing state
+                logger.info("Reminder %s updated successfully.", reminder_id)
+            else:
+                # Adding a new reminder
+                reminder = Reminder(title, description, trigger_time)
+                self.reminders[reminder.id] = reminder
+
+            # Schedule the (new or rescheduled) reminder
+            self._schedule_reminder(reminder)
 
             # Clear input fields
             self.title_entry.delete(0, tk.END)
             self.description_entry.delete("1.0", tk.END)
             self.time_entry.delete(0, tk.END)
 
-            # Refresh list and go back to main screen
-            self._refresh_list()
+            # Update the reminder's card and go back to main screen
+            self._upsert_card(reminder)
+            self._update_scroll_region()
             self._show_screen(self.main_screen)
 
-            # Save reminders to file
-            self._save_reminders()
+            # Record the change in the journal
+            self._append_journal({"op": "put", "reminder": reminder.to_dict()})
 
             messagebox.showinfo("Success", "Reminder added successfully!" if not hasattr(self, 'editing_reminder_id') else "Reminder updated successfully!")
         except ValueError:
@@ -322,12 +515,11 @@ class ReminderApp:
         """
         Open the Add Reminder screen with the data of the selected reminder for editing.
         """
-        with self.reminders_lock:
-            if reminder_id not in self.reminders:
-                messagebox.showerror("Error", "Reminder not found.")
-                return
+        if reminder_id not in self.reminders:
+            messagebox.showerror("Error", "Reminder not found.")
+            return
 
-            reminder = self.reminders[reminder_id]
+        reminder = self.reminders[reminder_id]
 
         # Set fields with the reminder data
         self.title_entry.delete(0, tk.END)
@@ -349,164 +541,224 @@ class ReminderApp:
     
     def _refresh_list(self):
         """
-        Refresh the reminder list as cards that take the full width of the container.
+        Rebuild every reminder card from scratch. Only used on startup; later
+        changes update individual cards through _upsert_card.
         """
-        print("Refreshing reminder list...")
+        logger.debug("Refreshing reminder list...")
         try:
             for widget in self.reminder_list.winfo_children():
                 widget.destroy()  # Destroy all widgets in the list
         except Exception as e:
-            print(f"Error destroying widgets: {e}")  # Log any errors
-
-        with self.reminders_lock:
-            for reminder_id, reminder in self.reminders.items():
-                print(f"Creating card for reminder ID: {reminder_id}")
-                status = "Active" if reminder.is_active else "Expired"
-
-                # Full-width Card Frame
-                card_frame = tk.Frame(self.reminder_list, relief=tk.RIDGE, borderwidth=2, padx=10, pady=10, bg="white")
-                card_frame.pack(fill=tk.X, padx=10, pady=5)
-
-                # Reminder details
-                title_label = tk.Label(card_frame, text=f"Title: {reminder.title}", font=("Arial", 12, "bold"), bg="white")
-                title_label.pack(anchor="w", pady=(0, 5))
-
-                description_label = tk.Label(
-                    card_frame,
-                    text=f"Description: {reminder.description}",
-                    wraplength=self.canvas.winfo_width() - 40,
-                    bg="white"
-                )
-                description_label.pack(anchor="w", pady=(0, 5))
-
-                time_label = tk.Label(
-                    card_frame,
-                    text=f"Time: {reminder.trigger_time.strftime('%Y-%m-%d %H:%M')} ({status})",
-                    bg="white"
-                )
-                time_label.pack(anchor="w", pady=(0, 5))
-
-               # Add a container for the buttons (to group them together)
-                button_container = tk.Frame(card_frame, bg="white")
-                button_container.pack(anchor="e", pady=(0, 5))
-
-                # Remove button
-                remove_button = tk.Button(
-                    button_container,
-                    text="Remove",
-                    image=self.trash_icon,
-                    compound="left",
-                    command=lambda r_id=reminder_id: self._remove_reminder(r_id),
-                    bg="#FF4C4C",
-                    fg="white"
-                )
-                remove_button.pack(side=tk.LEFT, padx=5)
-
-                # Edit button
-                edit_button = tk.Button(
-                    button_container,
-                    text="Edit",
-                     image=self.edit_icon,
-                    compound="left",
-                    command=lambda r_id=reminder_id: self._edit_reminder(r_id),
-                    bg="#3797AC",
-                    fg="white"
-                )
-                edit_button.pack(side=tk.LEFT, padx=5)
-
-        # Update the scroll region based on the size of the reminder_list
-        self.canvas.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            logger.error("Error destroying widgets: %s", e)
+        self._card_widgets.clear()
+        self._wraplength = max(MIN_WRAPLENGTH, self.canvas.winfo_width() - 40)
 
-        print("Reminder list refreshed.")
+        for reminder in self.reminders.values():
+            self._upsert_card(reminder)
 
+        self._update_scroll_region()
+
+        logger.debug("Reminder list refreshed.")
+
+    def _upsert_card(self, reminder):
+        """
+        Create the card for a reminder as a full-width frame, or update the labels
+        of its existing card in place.
+        """
+        status = "Active" if reminder.is_active else "Expired"
+        card = self._card_widgets.get(reminder.id)
+        if card is not None:
+            card["title"].config(text=f"Title: {reminder.title}")
+            card["desc"].config(text=f"Description: {reminder.description}")
+            card["time"].config(text=f"Time: {reminder.trigger_str} ({status})")
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating card for reminder ID: %s", reminder.id)
+
+        # Full-width Card Frame
+        card_frame = tk.Frame(self.reminder_list, relief=tk.RIDGE, borderwidth=2, padx=10, pady=10, bg="white")
+        card_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        # Reminder details
+        title_label = tk.Label(card_frame, text=f"Title: {reminder.title}", font=("Arial", 12, "bold"), bg="white")
+        title_label.pack(anchor="w", pady=(0, 5))
+
+        description_label = tk.Label(
+            card_frame,
+            text=f"Description: {reminder.description}",
+            wraplength=self._wraplength,
+            bg="white"
+        )
+        description_label.pack(anchor="w", pady=(0, 5))
+
+        time_label = tk.Label(
+            card_frame,
+            text=f"Time: {reminder.trigger_str} ({status})",
+            bg="white"
+        )
+        time_label.pack(anchor="w", pady=(0, 5))
+
+        # Add a container for the buttons (to group them together)
+        button_container = tk.Frame(card_frame, bg="white")
+        button_container.pack(anchor="e", pady=(0, 5))
+
+        # Remove button
+        remove_button = tk.Button(
+            button_container,
+            text="Remove",
+            image=self.trash_icon,
+            compound="left",
+            command=lambda r_id=reminder.id: self._remove_reminder(r_id),
+            bg="#FF4C4C",
+            fg="white"
+        )
+        remove_button.pack(side=tk.LEFT, padx=5)
+
+        # Edit button
+        edit_button = tk.Button(
+            button_container,
+            text="Edit",
+            image=self.edit_icon,
+            compound="left",
+            command=lambda r_id=reminder.id: self._edit_reminder(r_id),
+            bg="#3797AC",
+            fg="white"
+        )
+        edit_button.pack(side=tk.LEFT, padx=5)
+
+        self._card_widgets[reminder.id] = {
+            "frame": card_frame,
+            "title": title_label,
+            "desc": description_label,
+            "time": time_label,
+        }
+
+    def _update_scroll_region(self):
+        """
+        Update the scroll region based on the size of the reminder_list.
+        """
+        self.canvas.update_idletasks()
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def _remove_reminder(self, reminder_id):
         """
-        Remove a reminder and clean up monitoring thread.
+        Remove a reminder and cancel its pending timer.
         """
-        with self.reminders_lock:
-            # Check if reminder exists
-            if reminder_id not in self.reminders:
-                messagebox.showerror("Error", "Reminder not found or already removed.")
-                return
+        # Check if reminder exists
+        if reminder_id not in self.reminders:
+            messagebox.showerror("Error", "Reminder not found or already removed.")
+            return
 
-            # Mark reminder as inactive and remove it
-            reminder = self.reminders.pop(reminder_id)
-            reminder.is_active = False
+        # Mark reminder as inactive and remove it
+        reminder = self.reminders.pop(reminder_id)
+        reminder.is_active = False
 
-            # Stop and remove the associated thread
-            if reminder_id in self.monitoring_threads:
-                print(f"Stopping thread for reminder ID: {reminder_id}")
-                del self.monitoring_threads[reminder_id]
+        logger.info("Reminder %s removed successfully.", reminder_id)
 
-            print(f"Reminder {reminder_id} removed successfully.")
+        # Cancel the pending timer
+        self._cancel_reminder(reminder_id)
 
-        # Save the updated reminders to file
-        self._save_reminders()
+        # Record the removal in the journal
+        self._append_journal({"op": "del", "id": reminder_id})
 
-        # Update UI from the main thread
-        self.master.after(0, self._refresh_list)
+        # Drop the reminder's card
+        card = self._card_widgets.pop(reminder_id, None)
+        if card is not None:
+            card["frame"].destroy()
+            self._update_scroll_region()
         messagebox.showinfo("Success", "Reminder removed.")
 
         
-    def _monitor_reminder(self, reminder):
+    def _schedule_reminder(self, reminder):
         """
-        Monitor a reminder and trigger notification when it's time.
+        Insert a reminder into the due list, replacing any earlier entry for it.
         """
-        print(f"Started monitoring thread for reminder ID: {reminder.id}")
-        while not self.stop_event.is_set():
-            print(f"Started monitoring thread for reminder ID:{self.monitoring_threads[reminder.id]} {reminder.trigger_time}")
-            current_time = datetime.now()
-
-            # Check if reminder is inactive
-            if not reminder.is_active:
-                print(f"Stopping monitoring for reminder ID: {reminder.id}")
-                break
-
-            # Trigger notification when the time is due
-            if current_time >= reminder.trigger_time and reminder.is_active:
-                print(f"Triggering notification for reminder ID: {reminder.id}")
-                self.notification_queue.put({"title": reminder.title, "description": reminder.description})
+        self._unschedule(reminder.id)
+        bisect.insort(self._due, (reminder.trigger_time, reminder.id))
+        self._arm_due_timer()
 
-                # Mark the reminder as inactive
-                with self.reminders_lock:
-                    reminder.is_active = False
+    def _cancel_reminder(self, reminder_id):
+        """
+        Drop a reminder from the due list, if it is there.
+        """
+        if self._unschedule(reminder_id):
+            self._arm_due_timer()
 
-                # Update the UI from the main thread
-                self.master.after(0, self._refresh_list)
-                break
+    def _unschedule(self, reminder_id):
+        """
+        Remove the due-list entry of a reminder by linear scan; the list is short.
+        """
+        for index, (_, due_id) in enumerate(self._due):
+            if due_id == reminder_id:
+                del self._due[index]
+                return True
+        return False
 
-            # Sleep briefly before checking again
-            time.sleep(1)
+    def _arm_due_timer(self):
+        """
+        Point the single Tk timer at the earliest due reminder.
+        """
+        if self._due_job is not None:
+            self.master.after_cancel(self._due_job)
+            self._due_job = None
+        if self._due:
+            delay = (self._due[0][0] - datetime.now()).total_seconds()
+            # Timers are capped at MAX_AFTER_MS; a far-off head just re-arms when it fires early
+            ms = min(max(0, math.ceil(delay * 1000)), MAX_AFTER_MS)
+            self._due_job = self.master.after(ms, self._fire_due)
 
-        print(f"Exited monitoring thread for reminder ID: {reminder.id}")
+    def _fire_due(self):
+        """
+        Fire every reminder whose trigger time has passed, then re-arm the timer.
+        """
+        self._due_job = None
+        now = datetime.now()
+        # Re-arm even if a reminder fails to fire, or every later reminder would be stuck
+        try:
+            while self._due and self._due[0][0] <= now:
+                _, reminder_id = self._due.pop(0)
+                self._fire_reminder(reminder_id)
+        finally:
+            self._arm_due_timer()
 
-    def _handle_notifications(self):
+    def _fire_reminder(self, reminder_id):
         """
-        Handle and display notifications with an image and custom sound from the queue.
+        Trigger the notification for a due reminder. Runs on the Tk main thread.
         """
-        while not self.stop_event.is_set():
-            try:
-                notification = self.notification_queue.get(timeout=1)
-                print(f"Notification: {notification}")  # Debug: Check the notification data
+        reminder = self.reminders.get(reminder_id)
+        if reminder is None or not reminder.is_active:
+            return
 
-                # Play the custom sound
-                threading.Thread(target=self._play_sound, args=("C:/Users/dell/Desktop/reminder app/notification_sound.wav",), daemon=True).start()
+        reminder.is_active = False
 
-                # Show the notification window with an image
-                self.master.after(0, lambda n=notification: self._show_notification(n))
-            except queue.Empty:
-                continue
+        logger.debug("Triggering notification for reminder ID: %s", reminder_id)
+        notification = {"title": reminder.title, "description": reminder.description}
+
+        # Play the custom sound
+        if self._sound_enabled:
+            self._play_sound(SOUND_PATH)
+
+        # Show the notification window with an image
+        self._show_notification(notification)
+
+        # Show the reminder as expired
+        self._upsert_card(reminder)
 
     def _play_sound(self, sound_file):
         """
-        Play a custom sound using playsound.
+        Start playing a sound without blocking: winsound plays asynchronously on
+        Windows, elsewhere the platform's command-line player runs as a child process.
         """
         try:
-            playsound(sound_file)
+            if sys.platform == "win32":
+                winsound.PlaySound(sound_file, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+            elif sys.platform == "darwin":
+                subprocess.Popen(["afplay", sound_file])
+            else:
+                subprocess.Popen(["aplay", "-q", sound_file])
         except Exception as e:
-            print(f"Error playing sound: {e}")
+            logger.error("Error playing sound: %s", e)
 
     def _show_notification(self, notification):
         """
@@ -519,13 +771,11 @@ class ReminderApp:
         notif_window.resizable(False, False)
 
         try:
-            # Load and display an image in the notification
-            notif_image = ImageTk.PhotoImage(Image.open("bell.png").resize((50, 50)))
-            img_label = tk.Label(notif_window, image=notif_image)
-            img_label.image = notif_image  # Keep a reference to prevent garbage collection
+            # Display the cached bell image; the cache keeps it from being garbage collected
+            img_label = tk.Label(notif_window, image=_icon("bell.png", (50, 50)))
             img_label.pack(pady=10)
         except Exception as e:
-            print(f"Error loading image: {e}")
+            logger.error("Error loading image: %s", e)
 
         # Display notification text
         title_label = tk.Label(notif_window, text=f"Title: {notification['title']}", font=("Arial", 12, "bold"))
@@ -546,11 +796,22 @@ class ReminderApp:
         """
         Handle application closing
         """
-        self.stop_event.set()
+        # Cancel pending timers so nothing fires while the window is torn down
+        if self._due_job is not None:
+            self.master.after_cancel(self._due_job)
+        if self._resize_job is not None:
+            self.master.after_cancel(self._resize_job)
+
+        # Flush pending journal entries before the event loop goes away
+        if self._flush_job is not None:
+            self.master.after_cancel(self._flush_job)
+        self._flush_journal()
+
         self.master.destroy()
 
 
 def main():
+    logging.basicConfig(level=logging.INFO)
     root = tk.Tk()
     app = ReminderApp(root)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)